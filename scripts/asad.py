@@ -0,0 +1,159 @@
+"""
+asad — ASA warm-start daemon.
+
+Keeps score_applications imported and its SQLite connection open, and
+serves CLI requests over a Unix-domain socket so each `add` / `outreach`
+/ `status` skips Python startup and the database open.
+
+Protocol: one JSON object per line in, one JSON object per line out.
+  {"cmd": "add", "company": ..., "role": ...}  → {"ok": true, "application_id": N}
+  {"cmd": "outreach", "application_id": N, "channel": ...}  → {"ok": true}
+  {"cmd": "status", "application_id": N}  → {"ok": true, "snapshot": {...} | null}
+Failures reply {"ok": false, "error": "..."}.
+Every request carries "stamp" (see asad_socket.code_stamp()); a daemon
+whose code is older than the client's replies {"ok": false, "stale": true}
+and exits.
+
+Run in the foreground with: python3 -m scripts.asad
+"""
+import json
+import os
+import socket
+import socketserver
+import sqlite3
+
+from scripts.asad_socket import SOCKET_PATH, code_stamp, make_socket_dir
+
+# Exit after this many seconds without a request
+IDLE_TIMEOUT_SECONDS = 15 * 60
+
+# Drop a connected client that sends nothing for this long; clients send
+# their request right after connecting, so this only trips on stalled ones
+REQUEST_TIMEOUT_SECONDS = 2
+
+
+# ==================================================
+# Commands
+# ==================================================
+
+def _cmd_add(request):
+    from scripts.score_applications import add_application_with_customization
+
+    application_id = add_application_with_customization(
+        company=request["company"],
+        role=request["role"],
+        application_link=request.get("application_link"),
+        resume_customized=request.get("resume_customized", False),
+        cover_letter_customized=request.get("cover_letter_customized", False),
+    )
+
+    return {"application_id": application_id}
+
+
+def _cmd_outreach(request):
+    from scripts.score_applications import add_outreach
+
+    try:
+        add_outreach(
+            application_id=request["application_id"],
+            channel=request["channel"],
+            outreach_type=request.get("outreach_type", "initial"),
+        )
+    except sqlite3.IntegrityError:
+        # Foreign key: no such application
+        return {"found": False}
+
+    return {"found": True}
+
+
+def _cmd_status(request):
+    from scripts.score_applications import get_application_snapshot_fast
+
+    return {"snapshot": get_application_snapshot_fast(request["application_id"])}
+
+
+COMMANDS = {
+    "add": _cmd_add,
+    "outreach": _cmd_outreach,
+    "status": _cmd_status,
+}
+
+
+# ==================================================
+# Server
+# ==================================================
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    # Socket timeout per connection: a silent client cannot block the daemon
+    timeout = REQUEST_TIMEOUT_SECONDS
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+
+            if request.get("stamp") != self.server.stamp:
+                # Code changed since startup: let the client run it in-process
+                self.server.idle = True
+                reply = {"ok": False, "stale": True}
+            else:
+                reply = COMMANDS[request["cmd"]](request)
+                reply["ok"] = True
+        except Exception as exc:
+            reply = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    # Requests are served one at a time: they all share one connection
+    idle = False
+    stamp = None
+
+    def handle_timeout(self):
+        self.idle = True
+
+
+def is_running(socket_path=SOCKET_PATH):
+    """
+    True if a daemon is accepting connections on socket_path.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path=SOCKET_PATH, idle_timeout=IDLE_TIMEOUT_SECONDS):
+    if not make_socket_dir(os.path.dirname(socket_path)):
+        print(f"asad: {os.path.dirname(socket_path)} is not a private directory; not serving")
+        return
+
+    if is_running(socket_path):
+        print(f"asad already running on {socket_path}")
+        return
+
+    # Stale socket left by a daemon that did not shut down cleanly
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    # Warm up once: module import + shared connection
+    from scripts.score_applications import get_connection
+    get_connection()
+
+    server = _DaemonServer(socket_path, _RequestHandler)
+    server.timeout = idle_timeout
+    server.stamp = code_stamp()
+
+    try:
+        while not server.idle:
+            server.handle_request()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    serve()
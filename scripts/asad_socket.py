@@ -0,0 +1,72 @@
+"""
+Where the asad daemon listens, and the code stamp requests carry.
+
+Shared by scripts/asad.py and the CLI client in scripts/cli_commands.py.
+Imports only os, stat and zlib, so a CLI round-trip does not pay for the
+daemon's own imports (socketserver, sqlite3, ...).
+"""
+import os
+import stat
+import zlib
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Same file as score_applications.DB_PATH (not imported: keeps the client light)
+DB_PATH = os.path.join(os.path.dirname(_HERE), "data", "asa.db")
+
+# Unix socket paths are limited to ~100 bytes, so the socket lives in the
+# runtime/temp dir rather than inside the checkout: in a per-user
+# directory (mode 0700, see socket_dir_is_private()), named per database
+SOCKET_DIR = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp",
+    "asad-%d" % os.getuid(),
+)
+SOCKET_PATH = os.path.join(SOCKET_DIR, "%08x.sock" % zlib.crc32(DB_PATH.encode()))
+
+# Modules the daemon serves from; edits to them make a running daemon stale
+_CODE_FILES = ("asad.py", "asad_socket.py", "score_applications.py")
+
+
+def socket_dir_is_private(socket_dir=SOCKET_DIR):
+    """
+    True if socket_dir is a real directory (not a symlink) owned by this
+    user and closed to everyone else. Anything else - including a
+    directory another local user created first - must not be used: its
+    owner could bind the socket and read or answer our requests.
+    """
+    try:
+        st = os.lstat(socket_dir)
+    except OSError:
+        return False
+
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and not st.st_mode & 0o077
+    )
+
+
+def make_socket_dir(socket_dir=SOCKET_DIR):
+    """
+    Creates socket_dir with mode 0700 if missing; returns whether it is
+    safe to use (see socket_dir_is_private()).
+    """
+    try:
+        os.mkdir(socket_dir, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return False
+
+    return socket_dir_is_private(socket_dir)
+
+
+def code_stamp():
+    """
+    Fingerprint of the daemon's code (file mtimes), compared on every
+    request so a daemon started before a `git pull` is not reused.
+    """
+    return ":".join(
+        str(os.stat(os.path.join(_HERE, name)).st_mtime_ns)
+        for name in _CODE_FILES
+    )
@@ -1,92 +1,48 @@
 import argparse
+import os
+import sys
 
-from scripts.score_applications import (
-    add_application,
-    add_customization,
-    add_outreach,
-    get_application_snapshot,
-)
+VERSION = "1.1"
 
-print("CLI FILE EXECUTING")
+DESCRIPTION = "ASA v1.1 — Job Application CLI"
 
+# Pre-rendered top-level help (kept in sync with main()'s parser) so bare
+# invocations and -h/--help return without building any subparsers.
+_STATIC_HELP_TEXT = """\
+usage: {prog} [-h] [--version] {{add,outreach,status}} ...
 
-# --------------------
-# add
-# --------------------
-def add_application_cmd(args):
-    application_id = add_application(
-        company=args.company,
-        role=args.role,
-        application_link=args.link,
-    )
-
-    if args.resume_customized or args.cover_letter_customized:
-        add_customization(
-            application_id=application_id,
-            resume_customized=args.resume_customized,
-            cover_letter_customized=args.cover_letter_customized,
-        )
-
-    print(f"Application {application_id} added successfully.")
-
-
-# --------------------
-# outreach
-# --------------------
-def outreach_cmd(args):
-    add_outreach(
-        application_id=args.application_id,
-        channel=args.channel,
-        outreach_type=args.type,
-    )
-
-    print(f"Outreach logged for application {args.application_id} via {args.channel}.")
-
-
-# --------------------
-# status
-# --------------------
-def status_cmd(args):
-    snapshot = get_application_snapshot(args.application_id)
-
-    if not snapshot:
-        print(f"No application found with ID {args.application_id}")
-        return
+ASA v1.1 — Job Application CLI
 
-    base = snapshot["base"]
-    metrics = snapshot["metrics"]
+positional arguments:
+  {{add,outreach,status}}
 
-    print(f"\nApplication {args.application_id}")
-    print(f"Company: {base['company']}")
-    print(f"Role: {base['role']}")
+options:
+  -h, --help            show this help message and exit
+  --version             show program's version number and exit"""
 
-    submitted = base.get("submitted_at")
-    if submitted:
-        print(f"Submitted at: {submitted}")
 
-    print(f"\nState: {snapshot['state']}")
-    print(f"Outreach: {metrics['total_outreach_count']}")
-    print(f"Follow-ups: {metrics['follow_up_count']}")
+# ====================
+# SUBPARSERS (built lazily)
+# ====================
+def _prog():
+    """
+    Program name as argparse would render it.
+    """
+    return os.path.basename(sys.argv[0])
 
-    print(
-        f"Customization: resume {'✓' if metrics['resume_customized'] else '✗'} | "
-        f"cover letter {'✓' if metrics['cover_letter_customized'] else '✗'}"
-    )
 
-    print("\nInsights:")
-    for line in snapshot["narratives"]:
-        print(f"- {line}")
+def _sniff_subcommand(argv):
+    """
+    Returns the first known subcommand in argv, or None.
+    """
+    for token in argv:
+        if token in SUBPARSER_BUILDERS:
+            return token
+    return None
 
 
-# ====================
-# MAIN (TOP LEVEL)
-# ====================
-def main():
-    parser = argparse.ArgumentParser(
-        description="ASA v1.1 — Job Application CLI"
-    )
-
-    subparsers = parser.add_subparsers(dest="command", required=True)
+def p_add(subparsers):
+    from scripts.cli_commands import add_application_cmd
 
     add_parser = subparsers.add_parser("add")
     add_parser.add_argument("--company", required=True)
@@ -96,6 +52,10 @@ def main():
     add_parser.add_argument("--cover-letter-customized", action="store_true")
     add_parser.set_defaults(func=add_application_cmd)
 
+
+def p_outreach(subparsers):
+    from scripts.cli_commands import outreach_cmd
+
     outreach_parser = subparsers.add_parser("outreach")
     outreach_parser.add_argument("--application-id", type=int, required=True)
     outreach_parser.add_argument("--channel", required=True)
@@ -104,10 +64,54 @@ def main():
     )
     outreach_parser.set_defaults(func=outreach_cmd)
 
+
+def p_status(subparsers):
+    from scripts.cli_commands import status_cmd
+
     status_parser = subparsers.add_parser("status")
     status_parser.add_argument("--application-id", type=int, required=True)
     status_parser.set_defaults(func=status_cmd)
 
+
+SUBPARSER_BUILDERS = {
+    "add": p_add,
+    "outreach": p_outreach,
+    "status": p_status,
+}
+
+
+# ====================
+# MAIN (TOP LEVEL)
+# ====================
+def main():
+    argv = sys.argv[1:]
+
+    # Fast path: top-level help / version never touch argparse setup
+    if not argv or argv[0] in ("-h", "--help"):
+        print(_STATIC_HELP_TEXT.format(prog=_prog()))
+        return
+
+    if argv[0] == "--version":
+        print(f"{_prog()} {VERSION}")
+        return
+
+    parser = argparse.ArgumentParser(description=DESCRIPTION)
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {VERSION}"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Only build the subparser being invoked; build all of them when
+    # no subcommand was given so --help / usage errors still enumerate.
+    command = _sniff_subcommand(argv)
+
+    if command is not None:
+        SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for build in SUBPARSER_BUILDERS.values():
+            build(subparsers)
+
     args = parser.parse_args()
     args.func(args)
 
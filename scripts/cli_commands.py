@@ -0,0 +1,230 @@
+"""
+Subcommand handlers for scripts/cli.py.
+
+Kept out of cli.py so argument parsing stays small; cli.py imports
+only the handler for the subcommand being run.
+"""
+import os
+import sys
+
+# Give up waiting for the daemon's reply after this many seconds. Well
+# above asad.REQUEST_TIMEOUT_SECONDS: requests queue behind each other,
+# and a few stalled clients must not push ours past this limit
+DAEMON_TIMEOUT_SECONDS = 30
+
+# Commands that may be re-run in-process once the daemon has the request
+_READ_ONLY_COMMANDS = frozenset({"status"})
+
+
+# --------------------
+# daemon client
+# --------------------
+def _daemon_request(payload):
+    """
+    Sends one request to the asad daemon and returns its reply.
+    Returns None when the command should run in-process instead: no
+    usable daemon (the request was never delivered), a stale daemon
+    (it refused the request), or a read-only command that got no
+    usable reply. A write that got no usable reply exits with an
+    error instead - the daemon may still apply it, and running it
+    again would duplicate it. A missing daemon is started in the
+    background for next time. Set ASA_NO_DAEMON=1 to always run
+    in-process.
+    """
+    if os.environ.get("ASA_NO_DAEMON"):
+        return None
+
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    import json
+    from scripts.asad_socket import (
+        SOCKET_DIR,
+        SOCKET_PATH,
+        code_stamp,
+        socket_dir_is_private,
+    )
+
+    # Only talk to a socket in our own 0700 directory; if it does not
+    # exist yet the daemon creates it
+    if not socket_dir_is_private():
+        if not os.path.lexists(SOCKET_DIR):
+            _spawn_daemon()
+        return None
+
+    payload["stamp"] = code_stamp()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(DAEMON_TIMEOUT_SECONDS)
+
+        try:
+            sock.connect(SOCKET_PATH)
+        except (FileNotFoundError, ConnectionRefusedError):
+            _spawn_daemon()
+            return None
+        except OSError:
+            # e.g. path too long or permission denied: just run in-process
+            return None
+
+        try:
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            line = sock.makefile("rb").readline()
+        except OSError:
+            # Includes timeouts: a stuck daemon must not hang the CLI
+            line = b""
+
+    try:
+        reply = json.loads(line)
+    except ValueError:
+        reply = None
+
+    if not isinstance(reply, dict):
+        # No reply, or a garbled one, after the request went out
+        if payload["cmd"] in _READ_ONLY_COMMANDS:
+            return None
+        sys.exit(
+            "Error: no usable reply from asad; the command may still have "
+            "been applied, so check with `status` before re-running it."
+        )
+
+    if reply.get("stale"):
+        return None
+    if not reply.get("ok"):
+        sys.exit(f"Error: {reply.get('error')}")
+
+    return reply
+
+
+def _spawn_daemon():
+    import subprocess
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # No database yet → stay in-process (the daemon makes the socket dir)
+    if not os.path.isdir(os.path.join(root, "data")):
+        return
+
+    subprocess.Popen(
+        [sys.executable, "-m", "scripts.asad"],
+        cwd=root,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+# --------------------
+# add
+# --------------------
+def add_application_cmd(args):
+    reply = _daemon_request({
+        "cmd": "add",
+        "company": args.company,
+        "role": args.role,
+        "application_link": args.link,
+        "resume_customized": args.resume_customized,
+        "cover_letter_customized": args.cover_letter_customized,
+    })
+
+    if reply is not None:
+        application_id = reply["application_id"]
+    else:
+        import sqlite3
+        from scripts.score_applications import add_application_with_customization
+
+        try:
+            application_id = add_application_with_customization(
+                company=args.company,
+                role=args.role,
+                application_link=args.link,
+                resume_customized=args.resume_customized,
+                cover_letter_customized=args.cover_letter_customized,
+            )
+        except sqlite3.IntegrityError as exc:
+            # Same message the daemon path prints
+            sys.exit(f"Error: IntegrityError: {exc}")
+
+    print(f"Application {application_id} added successfully.")
+
+
+# --------------------
+# outreach
+# --------------------
+def outreach_cmd(args):
+    reply = _daemon_request({
+        "cmd": "outreach",
+        "application_id": args.application_id,
+        "channel": args.channel,
+        "outreach_type": args.type,
+    })
+
+    if reply is not None:
+        found = reply["found"]
+    else:
+        import sqlite3
+        from scripts.score_applications import add_outreach
+
+        try:
+            add_outreach(
+                application_id=args.application_id,
+                channel=args.channel,
+                outreach_type=args.type,
+            )
+            found = True
+        except sqlite3.IntegrityError:
+            # Foreign key: no such application
+            found = False
+
+    if not found:
+        print(f"No application found with ID {args.application_id}")
+        return
+
+    print(f"Outreach logged for application {args.application_id} via {args.channel}.")
+
+
+# --------------------
+# status
+# --------------------
+def status_cmd(args):
+    reply = _daemon_request({
+        "cmd": "status",
+        "application_id": args.application_id,
+    })
+
+    if reply is not None:
+        snapshot = reply["snapshot"]
+    else:
+        from scripts.score_applications import get_application_snapshot_fast
+
+        snapshot = get_application_snapshot_fast(args.application_id)
+
+    if not snapshot:
+        print(f"No application found with ID {args.application_id}")
+        return
+
+    base = snapshot["base"]
+    metrics = snapshot["metrics"]
+
+    print(f"\nApplication {args.application_id}")
+    print(f"Company: {base['company']}")
+    print(f"Role: {base['role']}")
+
+    submitted = base.get("submitted_at")
+    if submitted:
+        print(f"Submitted at: {submitted}")
+
+    print(f"\nState: {snapshot['state']}")
+    print(f"Outreach: {metrics['total_outreach_count']}")
+    print(f"Follow-ups: {metrics['follow_up_count']}")
+
+    print(
+        f"Customization: resume {'✓' if metrics['resume_customized'] else '✗'} | "
+        f"cover letter {'✓' if metrics['cover_letter_customized'] else '✗'}"
+    )
+
+    print("\nInsights:")
+    for line in snapshot["narratives"]:
+        print(f"- {line}")
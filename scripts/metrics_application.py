@@ -1,13 +1,72 @@
+import atexit
 import sqlite3
+import time
 from pathlib import Path
-from datetime import datetime, timezone
 
 # Database path
 DB_PATH = Path(__file__).resolve().parents[1] / "data" / "asa.db"
 
 
+_CONN = None
+
+
 def get_connection():
-    return sqlite3.connect(DB_PATH)
+    """
+    Returns the module's shared connection, opened on first use.
+    """
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_PATH, check_same_thread=False)
+        _CONN.row_factory = sqlite3.Row
+    return _CONN
+
+
+def close_connection():
+    global _CONN
+    if _CONN is not None:
+        _CONN.close()
+        _CONN = None
+
+
+atexit.register(close_connection)
+
+
+SECONDS_PER_DAY = 86400
+
+
+# -------------------------
+# SQL statements
+# -------------------------
+# The per-application queries behind the helpers below.
+
+_SQL_COUNT_OUTREACH = """
+    SELECT COUNT(*)
+    FROM outreach_events
+    WHERE application_id = ?
+"""
+
+_SQL_COUNT_FOLLOW_UPS = """
+    SELECT COUNT(*)
+    FROM outreach_events
+    WHERE application_id = ?
+      AND outreach_type = 'follow_up'
+"""
+
+_SQL_COUNT_STATUS_CHANGES = """
+    SELECT COUNT(*)
+    FROM status_history
+    WHERE application_id = ?
+"""
+
+_SQL_LAST_ACTION_EPOCH = """
+    SELECT CAST(strftime('%s', MAX(ts)) AS INTEGER) FROM (
+        SELECT timestamp AS ts FROM status_history WHERE application_id = :id
+        UNION ALL
+        SELECT timestamp AS ts FROM outreach_events WHERE application_id = :id
+        UNION ALL
+        SELECT created_at AS ts FROM applications WHERE application_id = :id
+    )
+"""
 
 
 # -------------------------
@@ -18,17 +77,9 @@ def total_outreach_count(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT COUNT(*)
-        FROM outreach_events
-        WHERE application_id = ?
-        """,
-        (application_id,)
-    )
+    cursor.execute(_SQL_COUNT_OUTREACH, (application_id,))
 
     count = cursor.fetchone()[0]
-    conn.close()
     return count
 
 
@@ -36,18 +87,9 @@ def follow_up_count(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT COUNT(*)
-        FROM outreach_events
-        WHERE application_id = ?
-          AND outreach_type = 'follow_up'
-        """,
-        (application_id,)
-    )
+    cursor.execute(_SQL_COUNT_FOLLOW_UPS, (application_id,))
 
     count = cursor.fetchone()[0]
-    conn.close()
     return count
 
 
@@ -55,25 +97,12 @@ def total_action_count(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT COUNT(*) FROM status_history
-        WHERE application_id = ?
-        """,
-        (application_id,)
-    )
+    cursor.execute(_SQL_COUNT_STATUS_CHANGES, (application_id,))
     status_count = cursor.fetchone()[0]
 
-    cursor.execute(
-        """
-        SELECT COUNT(*) FROM outreach_events
-        WHERE application_id = ?
-        """,
-        (application_id,)
-    )
+    cursor.execute(_SQL_COUNT_OUTREACH, (application_id,))
     outreach_count = cursor.fetchone()[0]
 
-    conn.close()
     return status_count + outreach_count
 
 
@@ -85,61 +114,68 @@ def effort_score_raw(application_id):
     # v1.1 definition: simple count of actions
     return total_action_count(application_id)
 
-def days_since_last_action(application_id):
+def days_since_last_action(application_id, now=None):
+    """
+    Whole days since the latest action; now is Unix epoch seconds.
+    Timestamps are converted to epoch in SQL (naive values are UTC).
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT MAX(ts) FROM (
-            SELECT timestamp AS ts FROM status_history WHERE application_id = ?
-            UNION ALL
-            SELECT timestamp AS ts FROM outreach_events WHERE application_id = ?
-            UNION ALL
-            SELECT created_at AS ts FROM applications WHERE application_id = ?
-        )
-        """,
-        (application_id, application_id, application_id)
-    )
+    cursor.execute(_SQL_LAST_ACTION_EPOCH, {"id": application_id})
 
     result = cursor.fetchone()[0]
-    conn.close()
 
     if result is None:
         return None
 
-    last_action_time = datetime.fromisoformat(result)
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = int(time.time())
 
-    # ensure both are timezone-aware
-    if last_action_time.tzinfo is None:
-        last_action_time = last_action_time.replace(tzinfo=timezone.utc)
+    return (now - result) // SECONDS_PER_DAY
 
-    return (now - last_action_time).days
 
+# (MAX(status_id), {application_id: latest status}) from the last build
+_latest_status_by_app = None
+
+
+def current_status_map():
+    """
+    Returns application_id → latest status for every application with
+    status history (latest = highest status_id, as in score_applications;
+    timestamps tie within a second), built by one grouped query. Reused
+    until a new status row is written (status_id moves).
+    """
+    global _latest_status_by_app
 
-def current_status(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT status
-        FROM status_history
-        WHERE application_id = ?
-        ORDER BY timestamp DESC
-        LIMIT 1
-        """,
-        (application_id,)
-    )
+    cursor.execute("SELECT MAX(status_id) FROM status_history")
+    key = cursor.fetchone()[0]
+
+    if _latest_status_by_app is None or _latest_status_by_app[0] != key:
+        cursor.execute(
+            """
+            SELECT application_id, status
+            FROM status_history
+            WHERE status_id IN (
+                SELECT MAX(status_id)
+                FROM status_history
+                GROUP BY application_id
+            )
+            """
+        )
+        _latest_status_by_app = (
+            key,
+            {row["application_id"]: row["status"] for row in cursor},
+        )
 
-    row = cursor.fetchone()
-    conn.close()
+    return _latest_status_by_app[1]
 
-    if row is None:
-        return None
 
-    return row[0]
+def current_status(application_id):
+    return current_status_map().get(application_id)
 
 # -------------------------
 # Application metrics view
@@ -148,6 +184,8 @@ def current_status(application_id):
 def application_metrics_view():
     """
     Returns one row per application with core behavioral metrics.
+    Single pass: one connection, one grouped query per source table,
+    then rows are assembled in Python with no further DB calls.
     """
     conn = get_connection()
     cursor = conn.cursor()
@@ -158,22 +196,73 @@ def application_metrics_view():
         FROM applications
         """
     )
+    application_ids = [row["application_id"] for row in cursor]
+
+    cursor.execute(
+        """
+        SELECT
+            application_id,
+            COUNT(*) AS n,
+            SUM(CASE WHEN outreach_type = 'follow_up' THEN 1 ELSE 0 END) AS fu
+        FROM outreach_events
+        GROUP BY application_id
+        """
+    )
+    outreach = {
+        row["application_id"]: (row["n"], row["fu"]) for row in cursor
+    }
+
+    cursor.execute(
+        """
+        SELECT application_id, COUNT(*) AS n
+        FROM status_history
+        GROUP BY application_id
+        """
+    )
+    status_counts = {row["application_id"]: row["n"] for row in cursor}
+
+    statuses = current_status_map()
 
-    application_ids = [row[0] for row in cursor.fetchall()]
-    conn.close()
+    cursor.execute(
+        """
+        SELECT
+            application_id,
+            CAST(strftime('%s', MAX(ts)) AS INTEGER) AS last_epoch
+        FROM (
+            SELECT application_id, timestamp AS ts FROM status_history
+            UNION ALL
+            SELECT application_id, timestamp AS ts FROM outreach_events
+            UNION ALL
+            SELECT application_id, created_at AS ts FROM applications
+        )
+        GROUP BY application_id
+        """
+    )
+    last_actions = {row["application_id"]: row["last_epoch"] for row in cursor}
 
+    now = int(time.time())
     rows = []
 
     for app_id in application_ids:
+        outreach_count, follow_ups = outreach.get(app_id, (0, 0))
+        action_count = status_counts.get(app_id, 0) + outreach_count
+
+        last_action = last_actions.get(app_id)
+        days_idle = (
+            (now - last_action) // SECONDS_PER_DAY
+            if last_action is not None
+            else None
+        )
+
         row = {
             "application_id": app_id,
-            "current_status": current_status(app_id),
-            "days_since_last_action": days_since_last_action(app_id),
-            "total_outreach_count": total_outreach_count(app_id),
-            "follow_up_count": follow_up_count(app_id),
-            "has_follow_up": has_follow_up(app_id),
-            "total_action_count": total_action_count(app_id),
-            "effort_score_raw": effort_score_raw(app_id),
+            "current_status": statuses.get(app_id),
+            "days_since_last_action": days_idle,
+            "total_outreach_count": outreach_count,
+            "follow_up_count": follow_ups,
+            "has_follow_up": follow_ups >= 1,
+            "total_action_count": action_count,
+            "effort_score_raw": action_count,
         }
         rows.append(row)
 
@@ -0,0 +1,54 @@
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path(__file__).resolve().parents[2] / "data" / "asa.db"
+
+def run():
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    # Per-application lookups filter on application_id and read MAX(timestamp)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_outreach_app_ts
+        ON outreach_events (application_id, timestamp);
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_response_app_ts
+        ON response_events (application_id, timestamp);
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_status_app_ts
+        ON status_history (application_id, timestamp);
+    """)
+
+    # Latest status per application: descending walk on the autoincrement id
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_status_app_id
+        ON status_history (application_id, status_id DESC);
+    """)
+
+    # Follow-up counts filter on application_id + outreach_type
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_outreach_app_type
+        ON outreach_events (application_id, outreach_type);
+    """)
+
+    # Channel metrics group by channel
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_outreach_channel
+        ON outreach_events (channel, application_id);
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_response_channel
+        ON response_events (channel);
+    """)
+
+    conn.commit()
+    conn.close()
+    print("Event indexes ready.")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,18 @@
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path(__file__).resolve().parents[2] / "data" / "asa.db"
+
+def run():
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    # journal_mode=WAL is persistent: set once, it sticks to the database file
+    cursor.execute("PRAGMA journal_mode=WAL;")
+    mode = cursor.fetchone()[0]
+
+    conn.close()
+    print(f"journal_mode is now {mode}.")
+
+if __name__ == "__main__":
+    run()
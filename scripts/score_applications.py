@@ -1,7 +1,82 @@
+import atexit
 import sqlite3
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
 
+__all__ = (
+    # Configuration & thresholds
+    "DB_PATH",
+    "IDLE_DAYS_THRESHOLD",
+    "MIN_CHANNEL_SAMPLE_SIZE",
+    "HIGH_IDLE_RATE_THRESHOLD",
+    "LOW_FOLLOW_UP_RATE_THRESHOLD",
+    "STABLE_RESPONSE_COUNT_THRESHOLD",
+    "CHANNEL_DEPENDENCY_THRESHOLD",
+    "STABLE_CHANNEL_RATIO_THRESHOLD",
+    "ACTIVITY_RATE_THRESHOLD",
+    "INACTIVITY_RATE_THRESHOLD",
+    # Database connection
+    "get_connection",
+    "close_connection",
+    # Pillar A — writes
+    "add_application",
+    "add_outreach",
+    "add_response",
+    "add_customization",
+    "add_application_with_customization",
+    "add_applications_bulk",
+    # Pillar B — metrics
+    "days_since_last_action",
+    "total_outreach_count",
+    "follow_up_count",
+    "response_count",
+    "status_change_count",
+    "customization_flags",
+    "has_follow_up",
+    "has_response",
+    "total_action_count",
+    "effort_score_raw",
+    "current_status",
+    "application_metrics_view",
+    "application_metrics_columns",
+    "channel_metrics_columns",
+    "channel_metrics_view",
+    "to_columns",
+    "to_rows",
+    "portfolio_aggregates_sql",
+    "portfolio_metrics_view",
+    # Pillar C — states
+    "Status",
+    "application_state",
+    "application_state_view",
+    "application_state_columns",
+    "channel_signal_state",
+    "channel_signal_state_view",
+    "portfolio_pattern",
+    "portfolio_pattern_view",
+    # Pillar D — narratives
+    "APPLICATION_STATE_TEMPLATES",
+    "APPLICATION_FLAG_TEMPLATES",
+    "CHANNEL_SIGNAL_TEMPLATES",
+    "CHANNEL_FLAG_TEMPLATES",
+    "PORTFOLIO_PATTERN_TEMPLATES",
+    "PORTFOLIO_FLAG_TEMPLATES",
+    "MAX_APPLICATIONS_DISPLAYED",
+    "MAX_APPLICATION_SENTENCES",
+    "MAX_CHANNEL_SENTENCES",
+    "MAX_PORTFOLIO_SENTENCES",
+    "describe_application",
+    "application_narratives_view",
+    "describe_channel",
+    "describe_portfolio",
+    "get_application_base",
+    "get_application_snapshot",
+    "get_application_snapshot_fast",
+    "assemble_insight_bundle",
+)
+
 # ==================================================
 # Configuration
 # ==================================================
@@ -25,12 +100,347 @@ STABLE_CHANNEL_RATIO_THRESHOLD = 0.30
 ACTIVITY_RATE_THRESHOLD = 1.0
 INACTIVITY_RATE_THRESHOLD = 0.5
 
+# ==================================================
+# SQL statements
+# ==================================================
+# Named statements, each shared by the functions that run it. Values
+# are always bound as parameters, never formatted in: sqlite3 caches
+# compiled statements by SQL text (up to cached_statements per
+# connection), so identical text is what lets a statement be reused.
+
+_SQL_INSERT_APPLICATION = """
+    INSERT INTO applications (
+        company,
+        role,
+        application_link,
+        created_at
+    )
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_INSERT_OUTREACH = """
+    INSERT INTO outreach_events (application_id, channel, outreach_type)
+    VALUES (?, ?, ?)
+"""
+
+_SQL_INSERT_RESPONSE = """
+    INSERT INTO response_events (application_id, channel, response_type)
+    VALUES (?, ?, ?)
+"""
+
+_SQL_UPSERT_CUSTOMIZATION = """
+    INSERT INTO application_customization
+    (application_id, resume_customized, cover_letter_customized, timestamp)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT (application_id) DO UPDATE SET
+        resume_customized = excluded.resume_customized,
+        cover_letter_customized = excluded.cover_letter_customized,
+        timestamp = excluded.timestamp
+"""
+
+_SQL_DAYS_SINCE_LAST_ACTION = """
+    SELECT CAST(julianday('now') - julianday(MAX(ts)) AS INTEGER) FROM (
+        SELECT created_at AS ts
+        FROM applications
+        WHERE application_id = ?
+
+        UNION ALL
+
+        SELECT timestamp AS ts
+        FROM outreach_events
+        WHERE application_id = ?
+
+        UNION ALL
+
+        SELECT timestamp AS ts
+        FROM response_events
+        WHERE application_id = ?
+
+        UNION ALL
+
+        SELECT timestamp AS ts
+        FROM status_history
+        WHERE application_id = ?
+    )
+"""
+
+_SQL_COUNT_OUTREACH = "SELECT COUNT(*) FROM outreach_events WHERE application_id = ?"
+
+_SQL_COUNT_FOLLOW_UPS = """
+    SELECT COUNT(*)
+    FROM outreach_events
+    WHERE application_id = ?
+      AND outreach_type = 'follow_up'
+"""
+
+_SQL_COUNT_RESPONSES = "SELECT COUNT(*) FROM response_events WHERE application_id = ?"
+
+_SQL_HAS_FOLLOW_UP = """
+    SELECT 1
+    FROM outreach_events
+    WHERE application_id = ?
+      AND outreach_type = 'follow_up'
+    LIMIT 1
+"""
+
+_SQL_HAS_RESPONSE = "SELECT 1 FROM response_events WHERE application_id = ? LIMIT 1"
+
+_SQL_COUNT_STATUS_CHANGES = """
+    SELECT COUNT(*) FROM status_history WHERE application_id = ?
+"""
+
+_SQL_CUSTOMIZATION_FLAGS = """
+    SELECT resume_customized, cover_letter_customized
+    FROM application_customization
+    WHERE application_id = ?
+"""
+
+_SQL_CURRENT_STATUS = """
+    SELECT status
+    FROM status_history
+    WHERE application_id = ?
+    ORDER BY status_id DESC
+    LIMIT 1
+"""
+
+_SQL_VIEW_CACHE_KEY = """
+    SELECT
+        (SELECT MAX(rowid) FROM applications),
+        (SELECT MAX(rowid) FROM outreach_events),
+        (SELECT MAX(rowid) FROM response_events),
+        (SELECT MAX(rowid) FROM status_history),
+        (SELECT MAX(rowid) FROM application_customization),
+        (SELECT data_version FROM pragma_data_version()),
+        strftime('%Y-%m-%d %H:%M', 'now')
+"""
+
+_SQL_APPLICATION_METRICS = """
+    SELECT
+        *,
+        CASE WHEN days_idle > :idle THEN 1 ELSE 0 END,
+        CASE WHEN outreach_total > 0 AND follow_ups = 0 THEN 1 ELSE 0 END
+    FROM (
+        SELECT
+            a.application_id,
+            COALESCE(cs.status, 'open'),
+            CAST(
+                julianday('now') - julianday(MAX(
+                    COALESCE(a.created_at, ''),
+                    COALESCE(o.last_ts, ''),
+                    COALESCE(r.last_ts, ''),
+                    COALESCE(s.last_ts, '')
+                ))
+                AS INTEGER
+            ) AS days_idle,
+            COALESCE(o.outreach_total, 0) AS outreach_total,
+            COALESCE(o.follow_ups, 0) AS follow_ups,
+            COALESCE(r.response_total, 0),
+            COALESCE(s.status_changes, 0),
+            COALESCE(c.resume_customized, 0),
+            COALESCE(c.cover_letter_customized, 0)
+        FROM applications a
+        LEFT JOIN (
+            SELECT
+                application_id,
+                COUNT(*) AS outreach_total,
+                SUM(outreach_type = 'follow_up') AS follow_ups,
+                MAX(timestamp) AS last_ts
+            FROM outreach_events
+            GROUP BY application_id
+        ) o USING (application_id)
+        LEFT JOIN (
+            SELECT
+                application_id,
+                COUNT(*) AS response_total,
+                MAX(timestamp) AS last_ts
+            FROM response_events
+            GROUP BY application_id
+        ) r USING (application_id)
+        LEFT JOIN (
+            SELECT
+                application_id,
+                COUNT(*) AS status_changes,
+                MAX(timestamp) AS last_ts
+            FROM status_history
+            GROUP BY application_id
+        ) s USING (application_id)
+        LEFT JOIN (
+            SELECT application_id, status
+            FROM status_history
+            WHERE status_id IN (
+                SELECT MAX(status_id)
+                FROM status_history
+                GROUP BY application_id
+            )
+        ) cs USING (application_id)
+        LEFT JOIN application_customization c USING (application_id)
+        ORDER BY a.application_id
+    )
+"""
+
+_SQL_CHANNEL_METRICS = """
+    SELECT
+        o.channel,
+        COUNT(*) AS outreach_count,
+        COUNT(DISTINCT o.application_id) AS app_coverage,
+        COALESCE(r.responses, 0) AS responses
+    FROM outreach_events o
+    LEFT JOIN (
+        SELECT channel, COUNT(*) AS responses
+        FROM response_events
+        GROUP BY channel
+    ) r ON r.channel = o.channel
+    GROUP BY o.channel
+    ORDER BY o.channel
+"""
+
+_SQL_PORTFOLIO_AGGREGATES = """
+    SELECT
+        COUNT(*),
+        SUM(COALESCE(o.follow_ups, 0) > 0),
+        SUM(COALESCE(o.outreach_total, 0) = 0),
+        SUM(
+            CAST(
+                julianday('now') - julianday(MAX(
+                    COALESCE(a.created_at, ''),
+                    COALESCE(o.last_ts, ''),
+                    COALESCE(r.last_ts, ''),
+                    COALESCE(s.last_ts, '')
+                ))
+                AS INTEGER
+            ) > ?
+        )
+    FROM applications a
+    LEFT JOIN (
+        SELECT
+            application_id,
+            COUNT(*) AS outreach_total,
+            SUM(outreach_type = 'follow_up') AS follow_ups,
+            MAX(timestamp) AS last_ts
+        FROM outreach_events
+        GROUP BY application_id
+    ) o USING (application_id)
+    LEFT JOIN (
+        SELECT application_id, MAX(timestamp) AS last_ts
+        FROM response_events
+        GROUP BY application_id
+    ) r USING (application_id)
+    LEFT JOIN (
+        SELECT application_id, MAX(timestamp) AS last_ts
+        FROM status_history
+        GROUP BY application_id
+    ) s USING (application_id)
+"""
+
+# Days between first and last application; NULL when there are none
+_SQL_APPLICATION_SPAN = """
+    SELECT julianday(MAX(created_at)) - julianday(MIN(created_at))
+    FROM applications
+"""
+
+_SQL_APPLICATION_BASE = """
+    SELECT company, role, application_link
+    FROM applications
+    WHERE application_id = ?
+"""
+
+_SQL_APPLICATION_SNAPSHOT = """
+    SELECT 'base', company, role, application_link
+    FROM applications
+    WHERE application_id = :id
+
+    UNION ALL
+
+    SELECT
+        'outreach',
+        COUNT(*),
+        COALESCE(SUM(outreach_type = 'follow_up'), 0),
+        CASE WHEN COUNT(*) > 0 AND SUM(outreach_type = 'follow_up') = 0 THEN 1 ELSE 0 END
+    FROM outreach_events
+    WHERE application_id = :id
+
+    UNION ALL
+
+    SELECT 'responses', COUNT(*), NULL, NULL
+    FROM response_events
+    WHERE application_id = :id
+
+    UNION ALL
+
+    SELECT 'status_history', COUNT(*), NULL, NULL
+    FROM status_history
+    WHERE application_id = :id
+
+    UNION ALL
+
+    SELECT 'days_idle', days_idle, CASE WHEN days_idle > :idle THEN 1 ELSE 0 END, NULL
+    FROM (
+        SELECT CAST(julianday('now') - julianday(MAX(ts)) AS INTEGER) AS days_idle
+        FROM (
+            SELECT created_at AS ts FROM applications WHERE application_id = :id
+            UNION ALL
+            SELECT timestamp AS ts FROM outreach_events WHERE application_id = :id
+            UNION ALL
+            SELECT timestamp AS ts FROM response_events WHERE application_id = :id
+            UNION ALL
+            SELECT timestamp AS ts FROM status_history WHERE application_id = :id
+        )
+    )
+
+    UNION ALL
+
+    SELECT 'current_status', status, NULL, NULL
+    FROM (
+        SELECT status
+        FROM status_history
+        WHERE application_id = :id
+        ORDER BY status_id DESC
+        LIMIT 1
+    )
+
+    UNION ALL
+
+    SELECT 'customization', resume_customized, cover_letter_customized, NULL
+    FROM application_customization
+    WHERE application_id = :id
+"""
+
 # ==================================================
 # Database connection
 # ==================================================
 
+@lru_cache(maxsize=1)
 def get_connection():
-    return sqlite3.connect(DB_PATH)
+    """
+    Returns the single shared connection for this process.
+    Opened lazily, closed once at interpreter exit.
+    Runs in autocommit mode; writers open explicit transactions.
+    """
+    conn = sqlite3.connect(
+        DB_PATH,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=512,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    conn.execute("PRAGMA foreign_keys=ON")
+
+    atexit.register(conn.close)
+    return conn
+
+
+def close_connection():
+    """
+    Closes the shared connection (if open) so the next
+    get_connection() call reopens it.
+    """
+    if get_connection.cache_info().currsize:
+        get_connection().close()
+        get_connection.cache_clear()
 
 # ==================================================
 # Time utilities (single source of truth)
@@ -39,11 +449,6 @@ def get_connection():
 def _utcnow():
     return datetime.now(timezone.utc)
 
-def _parse_ts(ts):
-    if ts is None:
-        return None
-    return datetime.fromisoformat(ts).replace(tzinfo=timezone.utc)
-
 # ==================================================
 # Pillar A — Core Write Functions
 # ==================================================
@@ -66,27 +471,21 @@ def add_application(
     if submitted_at is None:
         submitted_at = _utcnow().isoformat()
 
-    cursor.execute(
-        """
-        INSERT INTO applications (
-            company,
-            role,
-            application_link,
-            created_at
+    with conn:
+        cursor.execute("BEGIN")
+        cursor.execute(
+            _SQL_INSERT_APPLICATION,
+            (
+                company,
+                role,
+                application_link,
+                submitted_at,
+            ),
         )
-        VALUES (?, ?, ?, ?)
-        """,
-        (
-            company,
-            role,
-            application_link,
-            submitted_at,
-        ),
-    )
 
-    conn.commit()
+    _invalidate_view_cache()
+
     application_id = cursor.lastrowid
-    conn.close()
 
     return application_id
 
@@ -100,16 +499,14 @@ def add_outreach(application_id, channel, outreach_type="initial"):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        INSERT INTO outreach_events (application_id, channel, outreach_type)
-        VALUES (?, ?, ?)
-        """,
-        (application_id, channel, outreach_type),
-    )
+    with conn:
+        cursor.execute("BEGIN")
+        cursor.execute(
+            _SQL_INSERT_OUTREACH,
+            (application_id, channel, outreach_type),
+        )
 
-    conn.commit()
-    conn.close()
+    _invalidate_view_cache()
 
 
 def add_response(application_id, channel, response_type):
@@ -123,16 +520,15 @@ def add_response(application_id, channel, response_type):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        INSERT INTO response_events (application_id, channel, response_type)
-        VALUES (?, ?, ?)
-        """,
-        (application_id, channel, response_type),
-    )
+    with conn:
+        cursor.execute("BEGIN")
+        cursor.execute(
+            _SQL_INSERT_RESPONSE,
+            (application_id, channel, response_type),
+        )
+
+    _invalidate_view_cache()
 
-    conn.commit()
-    conn.close()
 
 def add_customization(
     application_id,
@@ -148,93 +544,115 @@ def add_customization(
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        INSERT OR REPLACE INTO application_customization
-        (application_id, resume_customized, cover_letter_customized, timestamp)
-        VALUES (?, ?, ?, ?)
-        """,
-        (
-            application_id,
-            int(resume_customized),
-            int(cover_letter_customized),
-            _utcnow().isoformat(),
-        ),
-    )
+    with conn:
+        cursor.execute("BEGIN")
+        cursor.execute(
+            _SQL_UPSERT_CUSTOMIZATION,
+            (
+                application_id,
+                int(resume_customized),
+                int(cover_letter_customized),
+                _utcnow().isoformat(),
+            ),
+        )
 
-    conn.commit()
-    conn.close()
+    _invalidate_view_cache()
 
-# ==================================================
-# Pillar B — Canonical Metrics & Time Awareness
-# ==================================================
+def add_application_with_customization(
+    company,
+    role,
+    application_link=None,
+    resume_customized=False,
+    cover_letter_customized=False,
+    submitted_at=None,
+):
+    """
+    Creates an application and (if any flag is set) its customization
+    record in a single transaction — one commit instead of two.
+    Returns the new application_id.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
 
-# ----------------------
-# B.0 — Thresholds
-# ----------------------
+    now = _utcnow().isoformat()
+    if submitted_at is None:
+        submitted_at = now
 
-IDLE_DAYS_THRESHOLD = 7
-MIN_CHANNEL_SAMPLE_SIZE = 5
-HIGH_IDLE_RATE_THRESHOLD = 0.30
-LOW_FOLLOW_UP_RATE_THRESHOLD = 0.50
-STABLE_RESPONSE_COUNT_THRESHOLD = 3
+    with conn:
+        cursor.execute("BEGIN")
+        cursor.execute(
+            _SQL_INSERT_APPLICATION,
+            (company, role, application_link, submitted_at),
+        )
+        application_id = cursor.lastrowid
 
+        if resume_customized or cover_letter_customized:
+            cursor.execute(
+                _SQL_UPSERT_CUSTOMIZATION,
+                (
+                    application_id,
+                    int(resume_customized),
+                    int(cover_letter_customized),
+                    now,
+                ),
+            )
 
-# ----------------------
-# B.1 — Time Core
-# ----------------------
+    _invalidate_view_cache()
 
-def _latest_timestamp(application_id):
+    return application_id
+
+def add_applications_bulk(rows):
     """
-    Returns the most recent timestamp across all events
-    for a given application_id.
+    Inserts many applications in one transaction (e.g. scripted imports).
+    rows: iterable of (company, role, application_link, submitted_at);
+    a None submitted_at defaults to the current UTC time.
+    Returns the number of rows inserted.
     """
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT MAX(ts) FROM (
-            SELECT created_at AS ts
-            FROM applications
-            WHERE application_id = ?
+    now = _utcnow().isoformat()
 
-            UNION ALL
+    with conn:
+        cursor.execute("BEGIN")
+        cursor.executemany(
+            _SQL_INSERT_APPLICATION,
+            (
+                (company, role, application_link, submitted_at or now)
+                for company, role, application_link, submitted_at in rows
+            ),
+        )
 
-            SELECT created_at AS ts
-            FROM outreach_events
-            WHERE application_id = ?
+    _invalidate_view_cache()
 
-            UNION ALL
+    return cursor.rowcount
 
-            SELECT timestamp AS ts
-            FROM response_events
-            WHERE application_id = ?
+# ==================================================
+# Pillar B — Canonical Metrics & Time Awareness
+# ==================================================
 
-            UNION ALL
+# ----------------------
+# B.1 — Time Core
+# ----------------------
 
-            SELECT created_at AS ts
-            FROM status_history
-            WHERE application_id = ?
-        )
-        """,
+def days_since_last_action(application_id):
+    """
+    Whole days since the most recent event for a given application_id,
+    computed in SQL (julianday) — no Python datetime parsing.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(
+        _SQL_DAYS_SINCE_LAST_ACTION,
         (application_id, application_id, application_id, application_id),
     )
 
     row = cursor.fetchone()
-    conn.close()
 
     return row[0]
 
 
-def days_since_last_action(application_id):
-    ts = _latest_timestamp(application_id)
-    if ts is None:
-        return None
-
-    last = datetime.fromisoformat(ts).replace(tzinfo=timezone.utc)
-    return (datetime.now(timezone.utc) - last).days
-
 # ----------------------
 # B.2 — Application-Level Counts
 # ----------------------
@@ -243,13 +661,9 @@ def total_outreach_count(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        "SELECT COUNT(*) FROM outreach_events WHERE application_id = ?",
-        (application_id,),
-    )
+    cursor.execute(_SQL_COUNT_OUTREACH, (application_id,))
 
     count = cursor.fetchone()[0]
-    conn.close()
     return count
 
 
@@ -257,18 +671,9 @@ def follow_up_count(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT COUNT(*)
-        FROM outreach_events
-        WHERE application_id = ?
-          AND outreach_type = 'follow_up'
-        """,
-        (application_id,),
-    )
+    cursor.execute(_SQL_COUNT_FOLLOW_UPS, (application_id,))
 
     count = cursor.fetchone()[0]
-    conn.close()
     return count
 
 
@@ -276,13 +681,9 @@ def response_count(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        "SELECT COUNT(*) FROM response_events WHERE application_id = ?",
-        (application_id,),
-    )
+    cursor.execute(_SQL_COUNT_RESPONSES, (application_id,))
 
     count = cursor.fetchone()[0]
-    conn.close()
     return count
 
 
@@ -290,30 +691,18 @@ def status_change_count(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        "SELECT COUNT(*) FROM status_history WHERE application_id = ?",
-        (application_id,),
-    )
+    cursor.execute(_SQL_COUNT_STATUS_CHANGES, (application_id,))
 
     count = cursor.fetchone()[0]
-    conn.close()
     return count
 
 def customization_flags(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT resume_customized, cover_letter_customized
-        FROM application_customization
-        WHERE application_id = ?
-        """,
-        (application_id,),
-    )
+    cursor.execute(_SQL_CUSTOMIZATION_FLAGS, (application_id,))
 
     row = cursor.fetchone()
-    conn.close()
 
     if row is None:
         return {
@@ -335,11 +724,22 @@ def customization_flags(application_id):
 # ----------------------
 
 def has_follow_up(application_id):
-    return follow_up_count(application_id) > 0
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    # stops at the first matching row instead of counting all of them
+    cursor.execute(_SQL_HAS_FOLLOW_UP, (application_id,))
+
+    return cursor.fetchone() is not None
 
 
 def has_response(application_id):
-    return response_count(application_id) > 0
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(_SQL_HAS_RESPONSE, (application_id,))
+
+    return cursor.fetchone() is not None
 
 
 def total_action_count(application_id):
@@ -362,23 +762,27 @@ def effort_score_raw(application_id):
 # B.4 — Application Status
 # ----------------------
 
+class Status(IntEnum):
+    """
+    Integer codes for the status values the classifiers compare on.
+    Any other free-text status maps to OTHER.
+    """
+    OTHER = 0
+    OPEN = 1
+    CLOSED = 2
+
+
+# Status text → plain int code, applied once where metrics rows are built
+_STATUS_CODES = {status.name.lower(): status.value for status in Status}
+
+
 def current_status(application_id):
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute(
-        """
-        SELECT status
-        FROM status_history
-        WHERE application_id = ?
-        ORDER BY created_at DESC
-        LIMIT 1
-        """,
-        (application_id,),
-    )
+    cursor.execute(_SQL_CURRENT_STATUS, (application_id,))
 
     row = cursor.fetchone()
-    conn.close()
 
     return row[0] if row else "open"
 
@@ -386,98 +790,278 @@ def current_status(application_id):
 # B.5 — Application Metrics View (Canonical)
 # ----------------------
 
+# {key, aggregates, rows?, columns?} for the last metrics query; see
+# _application_metrics_cache()
+_view_cache = None
+
+
+def _invalidate_view_cache():
+    global _view_cache
+    _view_cache = None
+
+
 def application_metrics_view():
+    """
+    Returns one row per application with core behavioral metrics.
+
+    Cached against the max rowid of every source table, the database's
+    data_version (bumped by commits from other connections, e.g. an
+    upsert that adds no row) and the current UTC minute (idle days move
+    with the clock). Writes through the add_* helpers drop the cache.
+    Rows are copies, so callers may mutate them.
+    """
+    cache = _application_metrics_cache()
+
+    if "rows" not in cache:
+        cache["rows"] = _build_application_metrics_rows(cache["aggregates"])
+
+    return [dict(r) for r in cache["rows"]]
+
+
+def _application_metrics_cache():
+    """
+    Refreshes the view cache if stale and returns it: the aggregate
+    tuples from one query over all tables (GROUP BY application_id
+    subqueries joined onto applications; threshold flags evaluated in
+    SQL), plus the row and column forms, each built on first use.
+    """
+    global _view_cache
+
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT application_id FROM applications")
-    application_ids = [r[0] for r in cursor.fetchall()]
-    conn.close()
-
-    rows = []
-
-    for app_id in application_ids:
-        customization = customization_flags(app_id)
-
-        days_idle = days_since_last_action(app_id)
-        outreach_total = total_outreach_count(app_id)
-        follow_ups = follow_up_count(app_id)
-
-        rows.append({
-            "application_id": app_id,
-            "current_status": current_status(app_id),
-            "days_since_last_action": days_idle,
-            "total_outreach_count": outreach_total,
-            "follow_up_count": follow_ups,
-            "has_follow_up": follow_ups > 0,
-            "responded_flag": has_response(app_id),
-            "total_action_count": total_action_count(app_id),
-            "effort_score_raw": effort_score_raw(app_id),
-            "has_zero_outreach": outreach_total == 0,
-            "has_no_follow_up": outreach_total > 0 and follow_ups == 0,
-            "is_idle_application": (
-                days_idle is not None and days_idle > IDLE_DAYS_THRESHOLD
-            ),
-            "resume_customized": customization["resume_customized"],
-            "cover_letter_customized": customization["cover_letter_customized"],
-            "any_customization": customization["any_customization"],
-        })
+    cursor.execute(_SQL_VIEW_CACHE_KEY)
+    key = cursor.fetchone()
 
-    return rows
+    if _view_cache is None or _view_cache["key"] != key:
+        cursor.execute(_SQL_APPLICATION_METRICS, {"idle": IDLE_DAYS_THRESHOLD})
+        _view_cache = {"key": key, "aggregates": cursor.fetchall()}
+
+    return _view_cache
+
+
+def _build_application_metrics_rows(aggregates):
+    return [
+        _metrics_row(
+            app_id,
+            status=status,
+            days_idle=days_idle,
+            outreach_total=outreach_total,
+            follow_ups=follow_ups,
+            response_total=response_total,
+            status_changes=status_changes,
+            resume=resume,
+            cover_letter=cover_letter,
+            is_idle=is_idle,
+            no_follow_up=no_follow_up,
+        )
+        for (
+            app_id,
+            status,
+            days_idle,
+            outreach_total,
+            follow_ups,
+            response_total,
+            status_changes,
+            resume,
+            cover_letter,
+            is_idle,
+            no_follow_up,
+        ) in aggregates
+    ]
+
+
+def _metrics_row(
+    application_id,
+    *,
+    status,
+    days_idle,
+    outreach_total,
+    follow_ups,
+    response_total,
+    status_changes,
+    resume,
+    cover_letter,
+    is_idle,
+    no_follow_up,
+):
+    """
+    Assembles one canonical metrics row from SQL aggregates
+    (threshold flags arrive precomputed as 0/1).
+    Shared by the bulk view and the single-application snapshot.
+    """
+    action_total = outreach_total + response_total + status_changes
+
+    return {
+        "application_id": application_id,
+        "current_status": status,
+        "current_status_code": _STATUS_CODES.get(status, Status.OTHER.value),
+        "days_since_last_action": days_idle,
+        "total_outreach_count": outreach_total,
+        "follow_up_count": follow_ups,
+        "has_follow_up": follow_ups > 0,
+        "responded_flag": response_total > 0,
+        "total_action_count": action_total,
+        "effort_score_raw": action_total,
+        "has_zero_outreach": outreach_total == 0,
+        "has_no_follow_up": bool(no_follow_up),
+        "is_idle_application": bool(is_idle),
+        "resume_customized": bool(resume),
+        "cover_letter_customized": bool(cover_letter),
+        "any_customization": bool(resume or cover_letter),
+    }
+
+def application_metrics_columns():
+    """
+    Column form of application_metrics_view(): metric name → tuple
+    of values, one entry per application in the same order. Shares
+    the view's cache; the tuples are immutable, so only the dict is
+    copied.
+    """
+    cache = _application_metrics_cache()
+
+    if "columns" not in cache:
+        cache["columns"] = _build_application_metrics_columns(cache["aggregates"])
+
+    return dict(cache["columns"])
+
+
+def _build_application_metrics_columns(aggregates):
+    """
+    Transposes the aggregate tuples with zip() and derives the
+    remaining metrics column-wise; keys match _metrics_row().
+    """
+    (
+        app_ids,
+        statuses,
+        days_idle,
+        outreach_totals,
+        follow_ups,
+        response_totals,
+        status_changes,
+        resume,
+        cover_letter,
+        is_idle,
+        no_follow_up,
+    ) = zip(*aggregates) if aggregates else ((),) * 11
+
+    other = Status.OTHER.value
+    action_totals = tuple(
+        o + r + s for o, r, s in zip(outreach_totals, response_totals, status_changes)
+    )
+
+    return {
+        "application_id": app_ids,
+        "current_status": statuses,
+        "current_status_code": tuple(_STATUS_CODES.get(s, other) for s in statuses),
+        "days_since_last_action": days_idle,
+        "total_outreach_count": outreach_totals,
+        "follow_up_count": follow_ups,
+        "has_follow_up": tuple(f > 0 for f in follow_ups),
+        "responded_flag": tuple(r > 0 for r in response_totals),
+        "total_action_count": action_totals,
+        "effort_score_raw": action_totals,
+        "has_zero_outreach": tuple(o == 0 for o in outreach_totals),
+        "has_no_follow_up": tuple(map(bool, no_follow_up)),
+        "is_idle_application": tuple(map(bool, is_idle)),
+        "resume_customized": tuple(map(bool, resume)),
+        "cover_letter_customized": tuple(map(bool, cover_letter)),
+        "any_customization": tuple(
+            bool(r or c) for r, c in zip(resume, cover_letter)
+        ),
+    }
 
 # ----------------------
 # B.6 — Channel Metrics View (Canonical)
 # ----------------------
 
-def channel_metrics_view():
+def channel_metrics_columns():
+    """
+    Returns channel metrics as columns (metric name → tuple of
+    values, one entry per channel) straight from one grouped query;
+    derived columns are computed column-wise.
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT DISTINCT channel FROM outreach_events")
-    channels = [r[0] for r in cursor.fetchall()]
+    cursor.execute(_SQL_CHANNEL_METRICS)
+    rows = cursor.fetchall()
 
-    rows = []
+    channels, outreach, coverage, responses = (
+        zip(*rows) if rows else ((), (), (), ())
+    )
 
-    for channel in channels:
-        cursor.execute(
-            "SELECT COUNT(*) FROM outreach_events WHERE channel = ?",
-            (channel,),
-        )
-        outreach_count = cursor.fetchone()[0]
+    return {
+        "channel_name": channels,
+        "outreach_count_by_channel": outreach,
+        "application_coverage_by_channel": coverage,
+        "response_count_by_channel": responses,
+        "response_rate_by_channel": tuple(
+            r / c if c > 0 else None
+            for r, c in zip(responses, coverage)
+        ),
+        "is_low_sample_channel": tuple(
+            o < MIN_CHANNEL_SAMPLE_SIZE for o in outreach
+        ),
+    }
 
-        cursor.execute(
-            "SELECT COUNT(DISTINCT application_id) FROM outreach_events WHERE channel = ?",
-            (channel,),
-        )
-        app_coverage = cursor.fetchone()[0]
 
-        cursor.execute(
-            "SELECT COUNT(*) FROM response_events WHERE channel = ?",
-            (channel,),
-        )
-        responses = cursor.fetchone()[0]
-
-        rows.append({
-            "channel_name": channel,
-            "outreach_count_by_channel": outreach_count,
-            "application_coverage_by_channel": app_coverage,
-            "response_count_by_channel": responses,
-            "response_rate_by_channel": (
-                responses / app_coverage if app_coverage > 0 else None
-            ),
-            "is_low_sample_channel": outreach_count < MIN_CHANNEL_SAMPLE_SIZE,
-        })
+def channel_metrics_view():
+    return to_rows(channel_metrics_columns())
 
-    conn.close()
-    return rows
+# ----------------------
+# B.7 — Row / Column Adaptors
+# ----------------------
+
+def to_columns(rows):
+    """
+    List of row dicts → dict of column tuples (keys from the first row),
+    the shape the *_columns() views return.
+    """
+    if not rows:
+        return {}
+
+    return {key: tuple(r[key] for r in rows) for key in rows[0]}
+
+
+def to_rows(columns):
+    """
+    Dict of equal-length columns → list of row dicts.
+    """
+    keys = tuple(columns)
+
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
 
 # ==================================================
 # Pillar B — Portfolio Metrics View
 # ==================================================
 
+def portfolio_aggregates_sql():
+    """
+    Returns portfolio-wide counts in a single aggregate query:
+      applications_total, follow_up_count,
+      zero_outreach_count, idle_count
+    Idle days are computed in SQL (julianday) from the latest
+    event across all tables.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(_SQL_PORTFOLIO_AGGREGATES, (IDLE_DAYS_THRESHOLD,))
+
+    total, follow_ups, zero_outreach, idle = cursor.fetchone()
+
+    return {
+        "applications_total": total,
+        "follow_up_count": follow_ups or 0,
+        "zero_outreach_count": zero_outreach or 0,
+        "idle_count": idle or 0,
+    }
+
+
 def portfolio_metrics_view():
-    app_rows = application_metrics_view()
-    applications_total = len(app_rows)
+    aggregates = portfolio_aggregates_sql()
+    applications_total = aggregates["applications_total"]
 
     if applications_total == 0:
         return {
@@ -490,32 +1074,23 @@ def portfolio_metrics_view():
             "low_follow_up_portfolio": None,
         }
 
-    follow_up_rate = sum(1 for r in app_rows if r["has_follow_up"]) / applications_total
-    zero_outreach_rate = sum(
-        1 for r in app_rows if r["total_outreach_count"] == 0
-    ) / applications_total
-    idle_application_rate = sum(
-        1 for r in app_rows if r["is_idle_application"]
-    ) / applications_total
+    follow_up_rate = aggregates["follow_up_count"] / applications_total
+    zero_outreach_rate = aggregates["zero_outreach_count"] / applications_total
+    idle_application_rate = aggregates["idle_count"] / applications_total
 
     high_idle_portfolio = idle_application_rate > HIGH_IDLE_RATE_THRESHOLD
     low_follow_up_portfolio = follow_up_rate < LOW_FOLLOW_UP_RATE_THRESHOLD
 
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT MIN(created_at), MAX(created_at) FROM applications")
-    min_ts, max_ts = cursor.fetchone()
-    conn.close()
+    cursor.execute(_SQL_APPLICATION_SPAN)
+    span_days = cursor.fetchone()[0]
 
     applications_per_week = None
 
-    if min_ts and max_ts:
-        start = _parse_ts(min_ts)
-        end = _parse_ts(max_ts)
-
-        if start and end:
-            weeks_active = max(1, ((end - start).days + 6) // 7)
-            applications_per_week = applications_total / weeks_active
+    if span_days is not None:
+        weeks_active = max(1, (int(span_days) + 6) // 7)
+        applications_per_week = applications_total / weeks_active
 
     return {
         "applications_total": applications_total,
@@ -531,67 +1106,192 @@ def portfolio_metrics_view():
 # Pillar C.1 — Application State
 # ==================================================
 
+# State code → name; codes are indexes into this tuple and rise
+# with precedence, so the winning state is the largest code that applies
+_APPLICATION_STATES = ("active", "engaged_idle", "unengaged", "closed")
+_APPLICATION_STATE_CODES = {name: code for code, name in enumerate(_APPLICATION_STATES)}
+_ENGAGED_IDLE_STATE = _APPLICATION_STATE_CODES["engaged_idle"]
+_UNENGAGED_STATE = _APPLICATION_STATE_CODES["unengaged"]
+_CLOSED_STATE = _APPLICATION_STATE_CODES["closed"]
+
+
+def _application_state_codes(status_codes, outreach_totals, days_idle, threshold):
+    """
+    Classifier kernel over parallel columns; returns a list of codes
+    into _APPLICATION_STATES. Branch-free: each predicate is scaled
+    to its state's code and the highest one wins. Constants are
+    bound as locals; no Python call is made per row.
+    """
+    closed_status = Status.CLOSED.value
+    closed, unengaged, idle = _CLOSED_STATE, _UNENGAGED_STATE, _ENGAGED_IDLE_STATE
+
+    return [
+        max(
+            closed * (status == closed_status),
+            unengaged * (outreach == 0),
+            idle * ((days or 0) > threshold),
+        )
+        for status, outreach, days in zip(status_codes, outreach_totals, days_idle)
+    ]
+
+
+def _application_state_code(
+    status_code,
+    outreach_total,
+    days_idle,
+    _CLOSED=Status.CLOSED.value,
+    _IDLE=IDLE_DAYS_THRESHOLD,
+    _CLOSED_STATE=_CLOSED_STATE,
+    _UNENGAGED_STATE=_UNENGAGED_STATE,
+    _ENGAGED_IDLE_STATE=_ENGAGED_IDLE_STATE,
+):
+    """
+    Scalar classifier behind application_state(): the rule of
+    _application_state_codes() for one application, with the same
+    named state weights, as a plain expression.
+    Constants are bound as defaults so they load as locals.
+    """
+    return max(
+        _CLOSED_STATE * (status_code == _CLOSED),
+        _UNENGAGED_STATE * (outreach_total == 0),
+        _ENGAGED_IDLE_STATE * ((days_idle or 0) > _IDLE),
+    )
+
+
 def application_state(metrics_row):
     """
     Determines the canonical state of an application.
     Exactly one state per application.
     """
 
-    if metrics_row["current_status"] == "closed":
-        return "closed"
-
-    if metrics_row["total_outreach_count"] == 0:
-        return "unengaged"
+    status_code = metrics_row.get("current_status_code")
+    if status_code is None:
+        status_code = _STATUS_CODES.get(
+            metrics_row["current_status"],
+            Status.OTHER.value,
+        )
 
-    days_idle = metrics_row.get("days_since_last_action")
+    return _APPLICATION_STATES[_application_state_code(
+        status_code,
+        metrics_row["total_outreach_count"],
+        metrics_row.get("days_since_last_action"),
+    )]
 
-    if days_idle is not None and days_idle > IDLE_DAYS_THRESHOLD:
-        return "engaged_idle"
 
-    return "active"
+def application_state_view(rows=None):
+    """
+    Metrics rows with application_state / application_state_code added.
+    rows: output of application_metrics_view(); pass it in when the
+    caller already has it (it is updated in place).
+    """
+    if rows is None:
+        rows = application_metrics_view()
+
+    # Column-wise: pull the three inputs once, classify them in the
+    # batch kernel, then write names and codes back in a single zip pass
+    codes = _application_state_codes(
+        [r["current_status_code"] for r in rows],
+        [r["total_outreach_count"] for r in rows],
+        [r["days_since_last_action"] for r in rows],
+        IDLE_DAYS_THRESHOLD,
+    )
 
+    for r, code in zip(rows, codes):
+        r["application_state"] = _APPLICATION_STATES[code]
+        r["application_state_code"] = code
 
-def application_state_view():
-    rows = application_metrics_view()
-    for r in rows:
-        r["application_state"] = application_state(r)
     return rows
 
+
+def application_state_columns(columns=None):
+    """
+    Column form of application_state_view(): takes (or builds) the
+    application_metrics_columns() dict and adds application_state and
+    application_state_code as whole columns; the kernel reads the
+    metric columns directly. Use to_rows() for row-oriented callers.
+    """
+    if columns is None:
+        columns = application_metrics_columns()
+
+    codes = tuple(_application_state_codes(
+        columns["current_status_code"],
+        columns["total_outreach_count"],
+        columns["days_since_last_action"],
+        IDLE_DAYS_THRESHOLD,
+    ))
+
+    columns["application_state"] = tuple(_APPLICATION_STATES[c] for c in codes)
+    columns["application_state_code"] = codes
+
+    return columns
+
 # ==================================================
 # Pillar C.2 — Channel Signal State
 # ==================================================
 
+# Signal code → name, weakest first; codes are indexes into this tuple
+_CHANNEL_SIGNAL_STATES = (
+    "no_signal",
+    "insufficient_data",
+    "emerging_signal",
+    "stable_signal",
+)
+_CHANNEL_SIGNAL_CODES = {name: code for code, name in enumerate(_CHANNEL_SIGNAL_STATES)}
+_NO_SIGNAL = _CHANNEL_SIGNAL_CODES["no_signal"]
+_INSUFFICIENT_DATA = _CHANNEL_SIGNAL_CODES["insufficient_data"]
+_EMERGING_SIGNAL = _CHANNEL_SIGNAL_CODES["emerging_signal"]
+_STABLE_SIGNAL = _CHANNEL_SIGNAL_CODES["stable_signal"]
+
+
+def _channel_signal_code(outreach_count, response_count):
+    """
+    Scalar classifier behind channel_signal_state(); returns a
+    code into _CHANNEL_SIGNAL_STATES.
+    """
+
+    if response_count == 0:
+        return _NO_SIGNAL
+
+    if outreach_count < MIN_CHANNEL_SAMPLE_SIZE:
+        return _INSUFFICIENT_DATA
+
+    if response_count >= STABLE_RESPONSE_COUNT_THRESHOLD:
+        return _STABLE_SIGNAL
+
+    return _EMERGING_SIGNAL
+
+
 def channel_signal_state(channel_row):
     """
     Determines signal strength for a single channel.
     """
 
-    outreach_count = channel_row["outreach_count_by_channel"]
     response_count = channel_row["response_count_by_channel"]
 
     flags = {
         "no_response_flag": response_count == 0
     }
 
-    if response_count == 0:
-        return "no_signal", flags
-
-    if outreach_count < MIN_CHANNEL_SAMPLE_SIZE:
-        return "insufficient_data", flags
-
-    if response_count >= STABLE_RESPONSE_COUNT_THRESHOLD:
-        return "stable_signal", flags
+    code = _channel_signal_code(
+        channel_row["outreach_count_by_channel"],
+        response_count,
+    )
 
-    return "emerging_signal", flags
+    return _CHANNEL_SIGNAL_STATES[code], flags
 
 
 def channel_signal_state_view():
     rows = channel_metrics_view()
 
     for r in rows:
-        state, flags = channel_signal_state(r)
-        r["channel_signal_state"] = state
-        r["channel_flags"] = flags
+        response_count = r["response_count_by_channel"]
+        code = _channel_signal_code(
+            r["outreach_count_by_channel"],
+            response_count,
+        )
+        r["channel_signal_state"] = _CHANNEL_SIGNAL_STATES[code]
+        r["channel_signal_code"] = code
+        r["channel_flags"] = {"no_response_flag": response_count == 0}
 
     return rows
 
@@ -599,12 +1299,6 @@ def channel_signal_state_view():
 # Pillar C.3 — Portfolio Pattern
 # ==================================================
 
-ACTIVITY_RATE_THRESHOLD = 1.0
-INACTIVITY_RATE_THRESHOLD = 0.5
-CHANNEL_DEPENDENCY_THRESHOLD = 0.60
-STABLE_CHANNEL_RATIO_THRESHOLD = 0.30
-
-
 def portfolio_pattern(portfolio_row):
     """
     Determines the dominant behavioral pattern
@@ -634,34 +1328,53 @@ def portfolio_pattern(portfolio_row):
     return "unstructured_bursting"
 
 
-def portfolio_pattern_view():
+def portfolio_pattern_view(channel_rows=None):
     """
     Attaches portfolio pattern and structural flags.
+    channel_rows: output of channel_signal_state_view(); pass it in
+    when the caller already has it to skip re-running the channel SQL.
     """
 
     row = portfolio_metrics_view()
     row["portfolio_pattern"] = portfolio_pattern(row)
 
-    channel_rows = channel_signal_state_view()
+    if channel_rows is None:
+        # Aggregate straight off the columns; no per-channel dicts
+        columns = channel_metrics_columns()
+        responses = columns["response_count_by_channel"]
+        codes = list(map(
+            _channel_signal_code,
+            columns["outreach_count_by_channel"],
+            responses,
+        ))
+
+        stable_channels = codes.count(_STABLE_SIGNAL)
+        total_responses = sum(responses)
+        max_responses = max(responses, default=0)
+        channel_count = len(responses)
+    else:
+        # Single pass over channels for all aggregates
+        stable_channels = 0
+        total_responses = 0
+        max_responses = 0
+        channel_count = 0
+
+        for c in channel_rows:
+            channel_count += 1
+            stable_channels += c["channel_signal_state"] == "stable_signal"
+            responses = c["response_count_by_channel"]
+            total_responses += responses
+            if responses > max_responses:
+                max_responses = responses
 
     # --- Low signal environment ---
-    stable_channels = sum(
-        1 for c in channel_rows
-        if c["channel_signal_state"] == "stable_signal"
-    )
-    total_channels = max(1, len(channel_rows))
+    total_channels = channel_count or 1
 
     row["low_signal_environment_flag"] = (
         stable_channels / total_channels
     ) < STABLE_CHANNEL_RATIO_THRESHOLD
 
     # --- Channel dependency ---
-    total_responses = sum(c["response_count_by_channel"] for c in channel_rows)
-    max_responses = max(
-        (c["response_count_by_channel"] for c in channel_rows),
-        default=0,
-    )
-
     if total_responses == 0:
         row["channel_dependency_flag"] = False
     else:
@@ -702,6 +1415,12 @@ APPLICATION_STATE_TEMPLATES = {
     },
 }
 
+# Flattened state → base sentence, built once at import
+_APP_BASE = {
+    state: template["base"]
+    for state, template in APPLICATION_STATE_TEMPLATES.items()
+}
+
 APPLICATION_FLAG_TEMPLATES = {
     "responded_flag": "A response has been received for this application.",
     "no_follow_up_flag": "No follow-up has been logged after initial outreach.",
@@ -712,23 +1431,27 @@ APPLICATION_FLAG_TEMPLATES = {
 # D.1.2 — Assembly Logic
 # --------------------------------------------------
 
-def _assemble_application_narrative(application_state, flags):
+def _assemble_application_narrative(application_state, flags, max_sentences=2):
     """
-    Assembles up to 2 sentences:
+    Assembles up to 2 sentences (fewer if max_sentences is lower):
       - Required base sentence
       - Optional single modifier
     """
 
-    base = APPLICATION_STATE_TEMPLATES.get(application_state, {}).get("base")
-    if base is None:
+    base = _APP_BASE.get(application_state)
+    if base is None or max_sentences < 1:
         return []
 
     sentences = [base]
 
-    for flag_name, sentence in APPLICATION_FLAG_TEMPLATES.items():
-        if flags.get(flag_name):
-            sentences.append(sentence)
-            break  # enforce max 2 sentences
+    if max_sentences < 2:
+        return sentences
+
+    # Single modifier, responded takes priority (enforces max 2 sentences)
+    if flags.get("responded_flag"):
+        sentences.append(APPLICATION_FLAG_TEMPLATES["responded_flag"])
+    elif flags.get("no_follow_up_flag"):
+        sentences.append(APPLICATION_FLAG_TEMPLATES["no_follow_up_flag"])
 
     return sentences
 
@@ -737,15 +1460,19 @@ def _assemble_application_narrative(application_state, flags):
 # D.1.3 — Public Interface
 # --------------------------------------------------
 
+@lru_cache(maxsize=64)
 def describe_application(
     *,
     application_state,
     no_follow_up_flag=False,
     responded_flag=False,
+    max_sentences=2,
 ):
     """
     Returns 1–2 neutral, descriptive sentences
     describing the current application state.
+    Memoized on the arguments (the state × flag space is tiny),
+    so the result is an immutable tuple.
     """
 
     flags = {
@@ -753,7 +1480,11 @@ def describe_application(
         "responded_flag": responded_flag,
     }
 
-    return _assemble_application_narrative(application_state, flags)
+    return tuple(_assemble_application_narrative(
+        application_state,
+        flags,
+        max_sentences,
+    ))
 
 # --------------------------------------------------
 # D.1.4 — Public Interface
@@ -824,9 +1555,8 @@ def _eligible_channel_sentences(channel_row):
     if state in {"no_signal", "insufficient_data"}:
         return base_sentence, []
 
-    for flag_name, sentence in CHANNEL_FLAG_TEMPLATES.items():
-        if flags.get(flag_name):
-            optional_sentences.append(sentence)
+    if flags.get("no_response_flag"):
+        optional_sentences.append(CHANNEL_FLAG_TEMPLATES["no_response_flag"])
 
     return base_sentence, optional_sentences
 
@@ -835,13 +1565,22 @@ def _eligible_channel_sentences(channel_row):
 # D.2.3 — Assembly Rules
 # --------------------------------------------------
 
-def _assemble_channel_summary(channel_row):
+def _assemble_channel_summary(channel_row, max_sentences=2):
     """
-    Assembles up to 2 sentences:
+    Assembles up to 2 sentences (fewer if max_sentences is lower):
       - Required base signal sentence
       - Optional single modifier
     """
 
+    if max_sentences < 2:
+        # Base sentence only: skip modifier eligibility entirely
+        base_sentence = CHANNEL_SIGNAL_TEMPLATES.get(
+            channel_row.get("channel_signal_state")
+        )
+        if base_sentence is None or max_sentences < 1:
+            return []
+        return [base_sentence]
+
     base_sentence, optional_sentences = _eligible_channel_sentences(channel_row)
 
     if base_sentence is None:
@@ -857,13 +1596,13 @@ def _assemble_channel_summary(channel_row):
 # D.2.4 — Public Interface
 # --------------------------------------------------
 
-def describe_channel(channel_row):
+def describe_channel(channel_row, max_sentences=2):
     """
     Returns 1–2 neutral, descriptive sentences
     summarizing the channel's current signal characteristics.
     """
 
-    return _assemble_channel_summary(channel_row)
+    return _assemble_channel_summary(channel_row, max_sentences)
 
 
 # ==================================================
@@ -888,6 +1627,17 @@ PORTFOLIO_FLAG_TEMPLATES = {
     "low_signal_environment_flag": "Across channels, response signals remain limited.",
 }
 
+# (flag, sentence) pairs in display priority, resolved once at import
+_PORTFOLIO_FLAG_PRIORITY = tuple(
+    (flag_name, PORTFOLIO_FLAG_TEMPLATES[flag_name])
+    for flag_name in (
+        "channel_dependency_flag",
+        "low_follow_up_portfolio_flag",
+        "high_idle_portfolio_flag",
+        "low_signal_environment_flag",
+    )
+)
+
 
 # --------------------------------------------------
 # D.3.2 — Eligibility Logic
@@ -898,7 +1648,7 @@ def _eligible_portfolio_sentences(portfolio_row):
     Determines eligible portfolio-level sentences.
     Returns:
       primary_sentence (str)
-      secondary_sentences (list[str])
+      secondary_sentences (list[(flag, str)], in display priority)
     """
 
     pattern = portfolio_row.get("portfolio_pattern")
@@ -909,7 +1659,7 @@ def _eligible_portfolio_sentences(portfolio_row):
 
     secondary_sentences = []
 
-    for flag_name, sentence in PORTFOLIO_FLAG_TEMPLATES.items():
+    for flag_name, sentence in _PORTFOLIO_FLAG_PRIORITY:
         if portfolio_row.get(flag_name):
             secondary_sentences.append((flag_name, sentence))
 
@@ -927,39 +1677,40 @@ def _eligible_portfolio_sentences(portfolio_row):
 # D.3.3 — Assembly Rules
 # --------------------------------------------------
 
-def _assemble_portfolio_summary(portfolio_row):
+def _assemble_portfolio_summary(portfolio_row, max_sentences=3):
     """
-    Assembles up to 3 sentences:
+    Assembles up to 3 sentences (fewer if max_sentences is lower):
       - 1 primary pattern sentence
       - Up to 2 secondary flag sentences
     """
 
+    if max_sentences < 2:
+        # Primary sentence only: skip flag eligibility entirely
+        primary_sentence = PORTFOLIO_PATTERN_TEMPLATES.get(
+            portfolio_row.get("portfolio_pattern")
+        )
+        if primary_sentence is None or max_sentences < 1:
+            return []
+        return [primary_sentence]
+
     primary_sentence, secondary_sentences = _eligible_portfolio_sentences(portfolio_row)
 
     if primary_sentence is None:
         return []
 
-    priority_order = [
-        "channel_dependency_flag",
-        "low_follow_up_portfolio_flag",
-        "high_idle_portfolio_flag",
-        "low_signal_environment_flag",
-    ]
-
-    ordered = []
-    for flag in priority_order:
-        for f, sentence in secondary_sentences:
-            if f == flag:
-                ordered.append(sentence)
+    # Already in priority order; keep the first eligible ones
+    limit = min(2, max_sentences - 1)
 
-    return [primary_sentence] + ordered[:2]
+    return [primary_sentence] + [
+        sentence for _, sentence in secondary_sentences[:limit]
+    ]
 
 
 # --------------------------------------------------
 # D.3.4 — Public Interface
 # --------------------------------------------------
 
-def describe_portfolio(portfolio_row):
+def describe_portfolio(portfolio_row, max_sentences=3):
     """
     Returns 1–3 neutral, descriptive sentences
     summarizing overall portfolio posture.
@@ -967,7 +1718,7 @@ def describe_portfolio(portfolio_row):
     if not portfolio_row:
         return []
 
-    summary = _assemble_portfolio_summary(portfolio_row)
+    summary = _assemble_portfolio_summary(portfolio_row, max_sentences)
 
     if isinstance(summary, list):
         return summary
@@ -981,17 +1732,9 @@ def get_application_base(application_id):
     conn = get_connection()
     cur = conn.cursor()
 
-    cur.execute(
-        """
-        SELECT company, role, application_link
-        FROM applications
-        WHERE application_id = ?
-        """,
-        (application_id,),
-    )
+    cur.execute(_SQL_APPLICATION_BASE, (application_id,))
 
     row = cur.fetchone()
-    conn.close()
 
     if not row:
         return None
@@ -1039,6 +1782,61 @@ def get_application_snapshot(application_id):
     }
 
 
+
+def get_application_snapshot_fast(application_id):
+    """
+    Same result as get_application_snapshot(), for a single application.
+    Reads identity and every per-app aggregate in one round-trip
+    (a tagged UNION ALL stream) instead of building the full views.
+    """
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute(
+        _SQL_APPLICATION_SNAPSHOT,
+        {"id": application_id, "idle": IDLE_DAYS_THRESHOLD},
+    )
+
+    parts = {kind: values for kind, *values in cur.fetchall()}
+
+    if "base" not in parts:
+        return None
+
+    company, role, application_link = parts["base"]
+    outreach_total, follow_ups, no_follow_up = parts["outreach"]
+    days_idle, is_idle, _ = parts["days_idle"]
+    resume, cover_letter, _ = parts.get("customization", (0, 0, None))
+
+    metrics = _metrics_row(
+        application_id,
+        status=parts.get("current_status", ["open"])[0],
+        days_idle=days_idle,
+        outreach_total=outreach_total,
+        follow_ups=follow_ups,
+        response_total=parts["responses"][0],
+        status_changes=parts["status_history"][0],
+        resume=resume,
+        cover_letter=cover_letter,
+        is_idle=is_idle,
+        no_follow_up=no_follow_up,
+    )
+
+    state = application_state(metrics)
+
+    return {
+        "application_id": application_id,
+        "base": {
+            "company": company,
+            "role": role,
+            "application_link": application_link,
+        },
+        "state": state,
+        "metrics": metrics,
+        # Metrics rows carry no "flags" key, so this is always {} - the
+        # same input application_narratives_view() ends up passing
+        "narratives": _assemble_application_narrative(state, {}),
+    }
+
 # ==================================================
 # D.4 — Global Orchestration & Suppression
 # ==================================================
@@ -1060,19 +1858,40 @@ MAX_PORTFOLIO_SENTENCES = 3
 def _filter_active_applications(application_rows):
     """
     Closed applications may not surface alongside active ones.
+    Compares the integer state code; rows built outside
+    application_state_view() fall back to their state name.
     """
-    active = [r for r in application_rows if r.get("application_state") != "closed"]
+    active = []
+
+    for r in application_rows:
+        code = r.get("application_state_code")
+        if code is None:
+            code = _APPLICATION_STATE_CODES.get(r.get("application_state"))
+        if code != _CLOSED_STATE:
+            active.append(r)
+
     return active if active else application_rows
 
 
 def _filter_low_signal_channels(channel_rows):
     """
-    Suppresses channels with no meaningful signal.
+    Suppresses channels with no meaningful signal
+    (codes below emerging_signal). Rows built outside
+    channel_signal_state_view() fall back to their state name.
     """
-    return [
-        r for r in channel_rows
-        if r.get("channel_signal_state") not in {"no_signal", "insufficient_data"}
-    ]
+    kept = []
+
+    for r in channel_rows:
+        code = r.get("channel_signal_code")
+        if code is None:
+            code = _CHANNEL_SIGNAL_CODES.get(
+                r.get("channel_signal_state"),
+                _EMERGING_SIGNAL,
+            )
+        if code >= _EMERGING_SIGNAL:
+            kept.append(r)
+
+    return kept
 
 
 # --------------------------------------------------
@@ -1098,7 +1917,10 @@ def assemble_insight_bundle(
     }
 
     # ---- Portfolio first ----
-    bundle["portfolio"] = describe_portfolio(portfolio_row)[:MAX_PORTFOLIO_SENTENCES]
+    bundle["portfolio"] = describe_portfolio(
+        portfolio_row,
+        max_sentences=MAX_PORTFOLIO_SENTENCES,
+    )
 
     # ---- Applications ----
     filtered_apps = _filter_active_applications(application_rows)
@@ -1108,12 +1930,13 @@ def assemble_insight_bundle(
             application_state=r.get("application_state"),
             no_follow_up_flag=r.get("has_no_follow_up", False),
             responded_flag=r.get("responded_flag", False),
+            max_sentences=MAX_APPLICATION_SENTENCES,
         )
 
         if narrative:
             bundle["applications"].append({
                 "application_id": r.get("application_id"),
-                "sentences": narrative[:MAX_APPLICATION_SENTENCES],
+                "sentences": list(narrative),
             })
 
     # ---- Channels ----
@@ -1121,11 +1944,11 @@ def assemble_insight_bundle(
         filtered_channels = _filter_low_signal_channels(channel_rows)
 
         for r in filtered_channels:
-            summary = describe_channel(r)
+            summary = describe_channel(r, max_sentences=MAX_CHANNEL_SENTENCES)
             if summary:
                 bundle["channels"].append({
                     "channel_name": r.get("channel_name"),
-                    "sentences": summary[:MAX_CHANNEL_SENTENCES],
+                    "sentences": summary,
                 })
 
     return bundle
@@ -1135,28 +1958,28 @@ def assemble_insight_bundle(
 # ==================================================
 
 if __name__ == "__main__":
+    import sys
 
-    print("\n==============================")
-    print("APPLICATION METRICS (Pillar B)")
-    print("==============================")
+    # Collect every line and write once at the end (one write, not one per row)
+    out = []
+
+    def section(title):
+        out.extend(("", "==============================", title, "=============================="))
+
+    section("APPLICATION METRICS (Pillar B)")
 
     app_metrics = application_metrics_view()
-    for r in app_metrics:
-        print(r)
+    out.extend(map(str, app_metrics))
 
-    print("\n==============================")
-    print("APPLICATION STATES (Pillar C)")
-    print("==============================")
+    section("APPLICATION STATES (Pillar C)")
 
-    app_states = application_state_view()
-    for r in app_states:
-        print(
-            f"Application {r['application_id']}: {r['application_state']}"
-        )
+    app_states = application_state_view(app_metrics)
+    out.extend(
+        f"Application {r['application_id']}: {r['application_state']}"
+        for r in app_states
+    )
 
-    print("\n==============================")
-    print("APPLICATION NARRATIVES (D.1)")
-    print("==============================")
+    section("APPLICATION NARRATIVES (D.1)")
 
     for r in app_states:
         narrative = describe_application(
@@ -1165,72 +1988,49 @@ if __name__ == "__main__":
             responded_flag=r.get("responded_flag", False),
         )
 
-        print(f"\nApplication {r['application_id']}:")
-        for s in narrative:
-            print("  -", s)
+        out.append(f"\nApplication {r['application_id']}:")
+        out.extend(f"  - {s}" for s in narrative)
 
-    print("\n==============================")
-    print("CHANNEL METRICS (Pillar B)")
-    print("==============================")
+    section("CHANNEL METRICS (Pillar B)")
 
     channel_rows = channel_metrics_view()
-    for r in channel_rows:
-        print(r)
+    out.extend(map(str, channel_rows))
 
-    print("\n==============================")
-    print("CHANNEL SIGNAL STATES (Pillar C.2)")
-    print("==============================")
+    section("CHANNEL SIGNAL STATES (Pillar C.2)")
 
     channel_states = channel_signal_state_view()
-    for r in channel_states:
-        print(
-            r["channel_name"],
-            r["channel_signal_state"],
-            r["channel_flags"],
-        )
+    out.extend(
+        f"{r['channel_name']} {r['channel_signal_state']} {r['channel_flags']}"
+        for r in channel_states
+    )
 
-    print("\n==============================")
-    print("CHANNEL SUMMARIES (D.2)")
-    print("==============================")
+    section("CHANNEL SUMMARIES (D.2)")
 
     for r in channel_states:
-        summary = describe_channel(r)
-        print(f"\n{r['channel_name']}:")
-        for s in summary:
-            print("  -", s)
+        out.append(f"\n{r['channel_name']}:")
+        out.extend(f"  - {s}" for s in describe_channel(r))
 
-    print("\n==============================")
-    print("PORTFOLIO METRICS (Pillar B)")
-    print("==============================")
+    section("PORTFOLIO METRICS (Pillar B)")
 
     portfolio_metrics = portfolio_metrics_view()
-    print(portfolio_metrics)
-
-    print("\n==============================")
-    print("PORTFOLIO PATTERN (Pillar C.3)")
-    print("==============================")
-
-    portfolio_row = portfolio_pattern_view()
-    print(
-        portfolio_row.get("portfolio_pattern"),
-        {
-            "high_idle": portfolio_row.get("high_idle_portfolio"),
-            "low_follow_up": portfolio_row.get("low_follow_up_portfolio"),
-            "channel_dependency": portfolio_row.get("channel_dependency_flag"),
-            "low_signal_environment": portfolio_row.get("low_signal_environment_flag"),
-        },
-    )
+    out.append(str(portfolio_metrics))
+
+    section("PORTFOLIO PATTERN (Pillar C.3)")
+
+    portfolio_row = portfolio_pattern_view(channel_rows=channel_states)
+    pattern_flags = {
+        "high_idle": portfolio_row.get("high_idle_portfolio"),
+        "low_follow_up": portfolio_row.get("low_follow_up_portfolio"),
+        "channel_dependency": portfolio_row.get("channel_dependency_flag"),
+        "low_signal_environment": portfolio_row.get("low_signal_environment_flag"),
+    }
+    out.append(f"{portfolio_row.get('portfolio_pattern')} {pattern_flags}")
 
-    print("\n==============================")
-    print("PORTFOLIO SUMMARY (D.3)")
-    print("==============================")
+    section("PORTFOLIO SUMMARY (D.3)")
 
-    for s in describe_portfolio(portfolio_row):
-        print("  -", s)
+    out.extend(f"  - {s}" for s in describe_portfolio(portfolio_row))
 
-    print("\n==============================")
-    print("FINAL INSIGHT BUNDLE (D.4)")
-    print("==============================")
+    section("FINAL INSIGHT BUNDLE (D.4)")
 
     bundle = assemble_insight_bundle(
         application_rows=app_states,
@@ -1238,19 +2038,18 @@ if __name__ == "__main__":
         portfolio_row=portfolio_row,
     )
 
-    print("\nPORTFOLIO:")
-    for s in bundle["portfolio"]:
-        print("  -", s)
+    out.append("\nPORTFOLIO:")
+    out.extend(f"  - {s}" for s in bundle["portfolio"])
 
-    print("\nAPPLICATIONS:")
+    out.append("\nAPPLICATIONS:")
     for app in bundle["applications"]:
-        print(f"  Application {app['application_id']}:")
-        for s in app["sentences"]:
-            print("    -", s)
+        out.append(f"  Application {app['application_id']}:")
+        out.extend(f"    - {s}" for s in app["sentences"])
 
-    print("\nCHANNELS:")
+    out.append("\nCHANNELS:")
     for ch in bundle["channels"]:
-        print(f"  {ch['channel_name']}:")
-        for s in ch["sentences"]:
-            print("    -", s)
+        out.append(f"  {ch['channel_name']}:")
+        out.extend(f"    - {s}" for s in ch["sentences"])
 
+    out.append("")
+    sys.stdout.write("\n".join(out))